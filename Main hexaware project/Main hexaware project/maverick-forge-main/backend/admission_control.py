@@ -0,0 +1,194 @@
+import math
+import threading
+import time
+from functools import wraps
+from typing import Dict, Any, Optional, Tuple
+
+from flask import jsonify
+
+# Lane settings: lower priority number wins when slots are contended.
+#   rate / burst       token bucket refill per second and capacity
+#   max_concurrency    requests of this lane running at once
+#   max_queue_depth    requests allowed to wait for a slot; beyond it -> 429
+#   queue_timeout      seconds a queued request waits before giving up
+DEFAULT_LANES = {
+    'interactive': {'priority': 0, 'rate': 50.0, 'burst': 100, 'max_concurrency': 8, 'max_queue_depth': 32, 'queue_timeout': 2.0},
+    'resume': {'priority': 1, 'rate': 5.0, 'burst': 10, 'max_concurrency': 4, 'max_queue_depth': 8, 'queue_timeout': 10.0},
+    'bulk': {'priority': 2, 'rate': 2.0, 'burst': 4, 'max_concurrency': 2, 'max_queue_depth': 4, 'queue_timeout': 10.0},
+}
+DEFAULT_TOTAL_SLOTS = 12
+
+# Retry-After for a lane switched off with rate 0, where no token ever refills
+CLOSED_LANE_RETRY_AFTER = 60.0
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket rate limiter. A rate of 0 closes the bucket
+    once its burst is spent.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        if rate < 0 or capacity < 0:
+            raise ValueError(f'Token bucket rate and capacity must not be negative (got {rate}, {capacity})')
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def try_acquire(self) -> float:
+        """Take a token. Returns 0 on success, otherwise seconds until one is available."""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return 0.0
+            if not self.rate:
+                return CLOSED_LANE_RETRY_AFTER
+            return (1 - self.tokens) / self.rate
+
+    def refund(self):
+        """Return a token taken by a request that was not admitted after all."""
+        with self._lock:
+            self.tokens = min(self.capacity, self.tokens + 1)
+
+
+class _Lane:
+    def __init__(self, name: str, priority: int, rate: float, burst: float,
+                 max_concurrency: int, max_queue_depth: int, queue_timeout: float):
+        self.name = name
+        self.priority = priority
+        self.bucket = TokenBucket(rate, burst)
+        self.max_concurrency = max_concurrency
+        self.max_queue_depth = max_queue_depth
+        self.queue_timeout = queue_timeout
+        self.in_flight = 0
+        self.waiting = 0
+        self.admitted = 0
+        self.rejected = {'rate_limited': 0, 'queue_full': 0, 'queue_timeout': 0}
+
+
+class AdmissionController:
+    """
+    Bounds concurrent work per priority lane. A request that would overflow
+    its lane's queue is rejected straight away; otherwise it takes a token
+    from the lane's bucket, then a slot, queueing while none is free. Tokens
+    are only spent by requests that are admitted. Lower-priority lanes do
+    not start work while a higher-priority lane has requests queued that
+    could use a slot.
+    """
+
+    def __init__(self, lanes: Optional[Dict[str, Dict[str, Any]]] = None,
+                 total_slots: Optional[int] = None):
+        # Overrides are merged per lane over the defaults; every default lane is kept
+        overrides = lanes or {}
+        settings = {
+            name: {**DEFAULT_LANES.get(name, {}), **overrides.get(name, {})}
+            for name in {**DEFAULT_LANES, **overrides}
+        }
+        self.lanes = {name: _Lane(name, **lane_settings) for name, lane_settings in settings.items()}
+        self.total_slots = total_slots or DEFAULT_TOTAL_SLOTS
+        self.in_flight = 0
+        self._condition = threading.Condition()
+
+    def _can_start(self, lane: _Lane) -> bool:
+        if lane.in_flight >= lane.max_concurrency or self.in_flight >= self.total_slots:
+            return False
+        return not any(
+            other.waiting and other.in_flight < other.max_concurrency
+            for other in self.lanes.values() if other.priority < lane.priority
+        )
+
+    def acquire(self, lane_name: str) -> Tuple[bool, float]:
+        """
+        Try to admit a request. Returns (True, 0) when admitted (call release()
+        afterwards), or (False, retry_after_seconds) when rejected.
+        """
+        lane = self.lanes[lane_name]
+        with self._condition:
+            can_start = self._can_start(lane)
+            # Check the queue before the bucket so a queue_full rejection costs no token
+            if not can_start and lane.waiting >= lane.max_queue_depth:
+                lane.rejected['queue_full'] += 1
+                return False, 1.0
+
+            retry_after = lane.bucket.try_acquire()
+            if retry_after:
+                lane.rejected['rate_limited'] += 1
+                return False, retry_after
+
+            if not can_start:
+                lane.waiting += 1
+                deadline = time.monotonic() + lane.queue_timeout
+                try:
+                    while not self._can_start(lane):
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            lane.bucket.refund()
+                            lane.rejected['queue_timeout'] += 1
+                            return False, 1.0
+                        self._condition.wait(remaining)
+                finally:
+                    lane.waiting -= 1
+                    # A lane leaving the queue may unblock lower-priority lanes
+                    self._condition.notify_all()
+
+            lane.in_flight += 1
+            lane.admitted += 1
+            self.in_flight += 1
+            return True, 0.0
+
+    def release(self, lane_name: str):
+        with self._condition:
+            self.lanes[lane_name].in_flight -= 1
+            self.in_flight -= 1
+            self._condition.notify_all()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Lane queue depths, in-flight counts and rejection counts for monitoring."""
+        with self._condition:
+            return {
+                'in_flight': self.in_flight,
+                'total_slots': self.total_slots,
+                'lanes': {
+                    name: {
+                        'queue_depth': lane.waiting,
+                        'in_flight': lane.in_flight,
+                        'admitted': lane.admitted,
+                        'rejected': dict(lane.rejected),
+                    }
+                    for name, lane in self.lanes.items()
+                },
+            }
+
+
+def admission_lane(lane_name: str):
+    """
+    Route decorator: admit the request through the app's admission controller
+    or answer 429 with Retry-After.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            # Imported here: shared_resources builds the controller from this module
+            from shared_resources import current_resources
+            controller = current_resources().admission
+            admitted, retry_after = controller.acquire(lane_name)
+            if not admitted:
+                response = jsonify({
+                    'error': 'Service is busy, please retry later',
+                    'lane': lane_name,
+                    'status': 'error'
+                })
+                response.status_code = 429
+                response.headers['Retry-After'] = str(max(1, math.ceil(retry_after)))
+                return response
+            try:
+                return view(*args, **kwargs)
+            finally:
+                controller.release(lane_name)
+        return wrapper
+    return decorator
@@ -22,6 +22,22 @@ class AIFeedbackGenerator:
             assignment_score = int(fresher_data.get('assignments', 0))
             certification_score = int(fresher_data.get('certifications', 0))
             
+            return self.generate_feedback_from_scores(
+                quiz_score, coding_score, assignment_score, certification_score
+            )
+            
+        except Exception as e:
+            return {
+                'error': f'Failed to generate feedback: {str(e)}',
+                'generated_at': datetime.now().isoformat()
+            }
+    
+    def generate_feedback_from_scores(self, quiz_score: int, coding_score: int,
+                                      assignment_score: int, certification_score: int) -> Dict[str, Any]:
+        """
+        Generate feedback from already-parsed integer scores
+        """
+        try:
             # Calculate overall performance
             overall_score = (quiz_score + coding_score + assignment_score + certification_score) / 4
             
@@ -1,80 +1,129 @@
-from flask import Flask, request, jsonify
+from flask import Flask, Blueprint, request, jsonify
 from flask_cors import CORS
 import json
+from typing import Dict, Any, Tuple
 from ai_feedback import AIFeedbackGenerator
+from batch_feedback import BatchFeedbackExecutor
+from feedback_schema import SINGLE_FEEDBACK_SCHEMA, BATCH_FEEDBACK_SCHEMA
+from admission_control import admission_lane
+from service_metrics import service_bp
+from shared_resources import init_app
 
-app = Flask(__name__)
-CORS(app)
+ai_feedback_bp = Blueprint('ai_feedback', __name__)
 
 # Initialize the AI feedback generator
 feedback_generator = AIFeedbackGenerator()
 
-@app.route('/api/ai-feedback', methods=['POST'])
-def generate_ai_feedback():
+# Large batches are sharded across a process pool; small ones stay inline
+batch_executor = BatchFeedbackExecutor(feedback_generator)
+
+# --- Operations (shared by the HTTP routes and the in-process API) ---
+def feedback_payload(fresher_data: Any) -> Tuple[Dict[str, Any], int]:
     """
-    Generate AI-powered feedback for a fresher
+    Generate feedback for one fresher. Returns the response body and HTTP status.
     """
     try:
-        # Get fresher data from request
-        fresher_data = request.get_json()
-        
         if not fresher_data:
-            return jsonify({
+            return {
                 'error': 'No fresher data provided',
                 'status': 'error'
-            }), 400
-        
+            }, 400
+
+        # Reject malformed records before doing any feedback work
+        scores, errors = SINGLE_FEEDBACK_SCHEMA.validate(fresher_data)
+        if errors:
+            return {
+                'error': 'Invalid fresher data',
+                'errors': errors,
+                'status': 'error'
+            }, 400
+
         # Generate feedback using AI
-        feedback = feedback_generator.generate_feedback(fresher_data)
-        
-        return jsonify({
+        feedback = feedback_generator.generate_feedback_from_scores(*scores)
+
+        return {
             'feedback': feedback,
             'status': 'success'
-        }), 200
-        
+        }, 200
+
     except Exception as e:
-        return jsonify({
+        return {
             'error': f'Failed to generate feedback: {str(e)}',
             'status': 'error'
-        }), 500
+        }, 500
 
-@app.route('/api/ai-feedback/batch', methods=['POST'])
-def generate_batch_feedback():
+def batch_feedback_payload(freshers_data: Any) -> Tuple[Dict[str, Any], int]:
     """
-    Generate AI feedback for multiple freshers
+    Generate feedback for a list of freshers. Returns the response body and HTTP status.
     """
     try:
-        # Get freshers data from request
-        freshers_data = request.get_json()
-        
         if not freshers_data or not isinstance(freshers_data, list):
-            return jsonify({
+            return {
                 'error': 'No freshers data provided or invalid format',
                 'status': 'error'
-            }), 400
-        
+            }, 400
+
+        # Validate every record up front; only valid ones go on to feedback
+        valid_indices, valid_scores, rejected = BATCH_FEEDBACK_SCHEMA.validate_batch(freshers_data)
+        if not valid_indices:
+            return {
+                'error': 'No valid freshers data provided',
+                'rejected': rejected,
+                'status': 'error'
+            }, 400
+
+        if rejected:
+            valid_freshers = [freshers_data[index] for index in valid_indices]
+        else:
+            valid_freshers = freshers_data
+
         # Generate feedback for each fresher
-        batch_feedback = []
-        for fresher_data in freshers_data:
-            feedback = feedback_generator.generate_feedback(fresher_data)
-            batch_feedback.append({
-                'fresher_id': fresher_data.get('id'),
-                'fresher_name': fresher_data.get('name'),
-                'feedback': feedback
-            })
-        
-        return jsonify({
+        batch_feedback = batch_executor.generate(valid_freshers, valid_scores)
+
+        return {
             'batch_feedback': batch_feedback,
-            'status': 'success'
-        }), 200
-        
+            'rejected': rejected,
+            'status': 'partial_success' if rejected else 'success'
+        }, 200
+
     except Exception as e:
-        return jsonify({
+        return {
             'error': f'Failed to generate batch feedback: {str(e)}',
             'status': 'error'
-        }), 500
+        }, 500
 
-@app.route('/api/ai-feedback/health', methods=['GET'])
+# --- Routes ---
+@ai_feedback_bp.route('/api/ai-feedback', methods=['POST'])
+@admission_lane('interactive')
+def generate_ai_feedback():
+    """
+    Generate AI-powered feedback for a fresher
+    """
+    try:
+        payload, status = feedback_payload(request.get_json())
+    except Exception as e:
+        payload, status = {
+            'error': f'Failed to generate feedback: {str(e)}',
+            'status': 'error'
+        }, 500
+    return jsonify(payload), status
+
+@ai_feedback_bp.route('/api/ai-feedback/batch', methods=['POST'])
+@admission_lane('bulk')
+def generate_batch_feedback():
+    """
+    Generate AI feedback for multiple freshers
+    """
+    try:
+        payload, status = batch_feedback_payload(request.get_json())
+    except Exception as e:
+        payload, status = {
+            'error': f'Failed to generate batch feedback: {str(e)}',
+            'status': 'error'
+        }, 500
+    return jsonify(payload), status
+
+@ai_feedback_bp.route('/api/ai-feedback/health', methods=['GET'])
 def health_check():
     """
     Health check endpoint
@@ -85,5 +134,16 @@ def health_check():
         'version': '1.0.0'
     }), 200
 
+def create_app():
+    """Standalone AI feedback service (port 5002)."""
+    app = Flask(__name__)
+    CORS(app)
+    init_app(app)
+    app.register_blueprint(ai_feedback_bp)
+    app.register_blueprint(service_bp)  # /metrics and request timing
+    return app
+
+app = create_app()
+
 if __name__ == '__main__':
-    app.run(debug=True, host='0.0.0.0', port=5002) 
\ No newline at end of file
+    app.run(debug=True, host='0.0.0.0', port=5002)
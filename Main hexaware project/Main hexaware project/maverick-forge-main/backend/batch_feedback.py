@@ -0,0 +1,161 @@
+import os
+import multiprocessing
+import threading
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Dict, List, Any, Optional, Tuple
+
+from ai_feedback import AIFeedbackGenerator
+from feedback_schema import SCORE_FIELDS, Scores
+
+# Cohorts smaller than this are processed inline; process start-up and
+# result pickling cost more than they save on small batches.
+DEFAULT_PARALLEL_THRESHOLD = int(os.getenv("AI_FEEDBACK_PARALLEL_THRESHOLD", "2000"))
+DEFAULT_MAX_WORKERS = int(os.getenv("AI_FEEDBACK_MAX_WORKERS", str(os.cpu_count() or 1)))
+MIN_CHUNK_SIZE = 250
+
+# Workers must not be forked from the multi-threaded Flask process; a fork
+# can inherit locks held by other threads and deadlock.
+_MP_CONTEXT = multiprocessing.get_context(
+    'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+)
+
+# Per-process generator, created once by the pool initializer
+_worker_generator: Optional[AIFeedbackGenerator] = None
+
+
+def _init_worker():
+    global _worker_generator
+    _worker_generator = AIFeedbackGenerator()
+
+
+def _process_chunk(shm_name: str, row_count: int, start: int, end: int) -> Tuple[int, List[Dict[str, Any]]]:
+    """Generate feedback for rows [start, end) of the shared score columns."""
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        columns = shm.buf.cast('i')
+        try:
+            quiz = columns[start:end].tolist()
+            coding = columns[row_count + start:row_count + end].tolist()
+            assignment = columns[2 * row_count + start:2 * row_count + end].tolist()
+            certification = columns[3 * row_count + start:3 * row_count + end].tolist()
+        finally:
+            columns.release()
+    finally:
+        shm.close()
+
+    generator = _worker_generator or AIFeedbackGenerator()
+    feedback = [
+        generator.generate_feedback_from_scores(q, c, a, cert)
+        for q, c, a, cert in zip(quiz, coding, assignment, certification)
+    ]
+    return start, feedback
+
+
+class BatchFeedbackExecutor:
+    """
+    Generates batch feedback inline for small cohorts and across a process
+    pool for large ones. Score columns are handed to workers through shared
+    memory; results are merged back in input order.
+    """
+
+    def __init__(self, feedback_generator: Optional[AIFeedbackGenerator] = None,
+                 max_workers: int = DEFAULT_MAX_WORKERS,
+                 parallel_threshold: int = DEFAULT_PARALLEL_THRESHOLD,
+                 chunk_size: Optional[int] = None):
+        self.feedback_generator = feedback_generator or AIFeedbackGenerator()
+        self.max_workers = max(1, max_workers)
+        self.parallel_threshold = parallel_threshold
+        self.chunk_size = chunk_size
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=self.max_workers, mp_context=_MP_CONTEXT,
+                                                 initializer=_init_worker)
+            return self._pool
+
+    def shutdown(self):
+        """Stop the worker processes, if any were started."""
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.shutdown()
+                self._pool = None
+
+    def should_parallelize(self, row_count: int) -> bool:
+        # A threshold of 0 forces the pool even for one worker (the benchmark's baseline)
+        if self.parallel_threshold <= 0:
+            return row_count > 0
+        return self.max_workers > 1 and row_count >= self.parallel_threshold
+
+    def _chunk_bounds(self, row_count: int) -> List[Tuple[int, int]]:
+        # A few chunks per worker keeps the pool busy when chunks finish unevenly
+        chunk_size = self.chunk_size or max(MIN_CHUNK_SIZE, -(-row_count // (self.max_workers * 4)))
+        return [(start, min(start + chunk_size, row_count)) for start in range(0, row_count, chunk_size)]
+
+    def generate(self, freshers_data: List[Dict[str, Any]],
+                 scores: Optional[List[Scores]] = None) -> List[Dict[str, Any]]:
+        """
+        Generate feedback entries for every fresher, preserving input order.
+        Pass scores already parsed by a FeedbackSchema to skip re-parsing.
+        """
+        if self.should_parallelize(len(freshers_data)):
+            feedback = self._generate_parallel(freshers_data, scores)
+        elif scores is not None:
+            generate_from_scores = self.feedback_generator.generate_feedback_from_scores
+            feedback = [generate_from_scores(*fresher_scores) for fresher_scores in scores]
+        else:
+            feedback = [self.feedback_generator.generate_feedback(fresher_data) for fresher_data in freshers_data]
+
+        return [
+            {
+                'fresher_id': fresher_data.get('id'),
+                'fresher_name': fresher_data.get('name'),
+                'feedback': fresher_feedback
+            }
+            for fresher_data, fresher_feedback in zip(freshers_data, feedback)
+        ]
+
+    def _generate_parallel(self, freshers_data: List[Dict[str, Any]],
+                           scores: Optional[List[Scores]] = None) -> List[Dict[str, Any]]:
+        row_count = len(freshers_data)
+        invalid_rows = []
+        if scores is not None:
+            columns = [array('i', column) for column in zip(*scores)]
+        else:
+            columns = [array('i', bytes(4 * row_count)) for _ in SCORE_FIELDS]
+            # Records whose scores cannot be parsed are generated inline so they
+            # keep producing the same error payload as the sequential path
+            for index, fresher_data in enumerate(freshers_data):
+                try:
+                    for column, field in zip(columns, SCORE_FIELDS):
+                        column[index] = int(fresher_data.get(field, 0))
+                except Exception:
+                    invalid_rows.append(index)
+
+        feedback: List[Optional[Dict[str, Any]]] = [None] * row_count
+        shm = shared_memory.SharedMemory(create=True, size=max(1, 4 * row_count * len(SCORE_FIELDS)))
+        try:
+            for position, column in enumerate(columns):
+                offset = 4 * row_count * position
+                shm.buf[offset:offset + 4 * row_count] = column.tobytes()
+
+            pool = self._get_pool()
+            futures = [
+                pool.submit(_process_chunk, shm.name, row_count, start, end)
+                for start, end in self._chunk_bounds(row_count)
+            ]
+            for future in futures:
+                start, chunk_feedback = future.result()
+                feedback[start:start + len(chunk_feedback)] = chunk_feedback
+        finally:
+            shm.close()
+            shm.unlink()
+
+        for index in invalid_rows:
+            feedback[index] = self.feedback_generator.generate_feedback(freshers_data[index])
+
+        return feedback
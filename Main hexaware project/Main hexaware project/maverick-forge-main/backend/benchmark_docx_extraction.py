@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Benchmark for DOCX text extraction
+Compares the streaming extractor against python-docx on a large document
+"""
+
+import argparse
+import io
+import time
+import tracemalloc
+import zipfile
+
+from docx_extractor import extract_docx_text, iter_docx_paragraphs
+
+CONTENT_TYPES = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">
+<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>
+<Default Extension="xml" ContentType="application/xml"/>
+<Override PartName="/word/document.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>
+</Types>"""
+
+PACKAGE_RELS = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="word/document.xml"/>
+</Relationships>"""
+
+def build_sample_docx(paragraph_count):
+    """Build a DOCX with body paragraphs and a skills table every 50 paragraphs"""
+    blocks = []
+    for index in range(paragraph_count):
+        blocks.append(f'<w:p><w:r><w:t>Project narrative line {index} using Python and React</w:t></w:r></w:p>')
+        if index % 50 == 0:
+            blocks.append(
+                '<w:tbl><w:tr>'
+                '<w:tc><w:p><w:r><w:t>SQL</w:t></w:r></w:p></w:tc>'
+                '<w:tc><w:p><w:r><w:t>Docker</w:t></w:r></w:p></w:tc>'
+                '</w:tr></w:tbl>'
+            )
+    document = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+        f'<w:body>{"".join(blocks)}</w:body></w:document>'
+    )
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr('[Content_Types].xml', CONTENT_TYPES)
+        archive.writestr('_rels/.rels', PACKAGE_RELS)
+        archive.writestr('word/document.xml', document)
+    return buffer.getvalue()
+
+def streamed_length(docx_file):
+    """Consume paragraphs without keeping them; shows the parser's own footprint"""
+    return sum(len(paragraph) + 1 for paragraph in iter_docx_paragraphs(docx_file))
+
+def streaming_text_length(docx_file):
+    return len(extract_docx_text(docx_file))
+
+def python_docx_text_length(docx_file):
+    """The previous python-docx implementation"""
+    from docx import Document
+    text = ""
+    document = Document(docx_file)
+    for paragraph in document.paragraphs:
+        text += paragraph.text + "\n"
+    return len(text)
+
+def measure(extract, data):
+    """Wall-clock time and peak traced memory for one extraction"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    chars = extract(io.BytesIO(data))
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak, chars
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark DOCX text extraction')
+    parser.add_argument('--paragraphs', type=int, nargs='+', default=[1000, 10000, 50000])
+    args = parser.parse_args()
+
+    extractors = [('streaming', streaming_text_length), ('stream-only', streamed_length)]
+    try:
+        import docx  # noqa: F401
+        extractors.append(('python-docx', python_docx_text_length))
+    except ImportError:
+        print("⚠️  python-docx not installed; reporting the streaming extractor only")
+
+    print(f"{'paragraphs':>10} {'extractor':>12} {'time (s)':>10} {'peak MiB':>10} {'chars':>10}")
+    for paragraph_count in args.paragraphs:
+        data = build_sample_docx(paragraph_count)
+        for name, extract in extractors:
+            elapsed, peak, chars = measure(extract, data)
+            print(f"{paragraph_count:>10} {name:>12} {elapsed:>10.3f} {peak / 2 ** 20:>10.2f} {chars:>10}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the Python service layout
+Compares memory footprint and request latency of the two-process layout
+(resume parser + AI feedback API) against the unified service, plus the
+in-process API
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+
+SAMPLE_FRESHER = {
+    'id': 1,
+    'name': 'Test User',
+    'quizzes': 75,
+    'coding': 80,
+    'assignments': 85,
+    'certifications': 70
+}
+
+def start_server(module_code, port):
+    """Run a Flask app in a child process without the debug reloader"""
+    code = f"{module_code}; app.run(host='127.0.0.1', port={port}, debug=False)"
+    return subprocess.Popen([sys.executable, '-c', code], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+def wait_until_healthy(url, timeout=30):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            with urllib.request.urlopen(url, timeout=1):
+                return
+        except Exception:
+            time.sleep(0.2)
+    raise RuntimeError(f"Service did not become healthy: {url}")
+
+def rss_mib(pid):
+    """Resident set size from /proc (Linux only)"""
+    with open(f'/proc/{pid}/status') as status:
+        for line in status:
+            if line.startswith('VmRSS:'):
+                return int(line.split()[1]) / 1024
+    return 0.0
+
+def post_latencies(url, body, requests_count):
+    data = json.dumps(body).encode()
+    latencies = []
+    for _ in range(requests_count):
+        request = urllib.request.Request(url, data=data, headers={'Content-Type': 'application/json'})
+        start = time.perf_counter()
+        with urllib.request.urlopen(request) as response:
+            response.read()
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+def summarize(label, latencies):
+    ordered = sorted(latencies)
+    p95 = ordered[int(len(ordered) * 0.95) - 1]
+    print(f"{label:<28} median {statistics.median(ordered) * 1000:>7.2f} ms   p95 {p95 * 1000:>7.2f} ms")
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare two-process and unified Python service layouts')
+    parser.add_argument('--requests', type=int, default=500)
+    args = parser.parse_args()
+
+    layouts = {
+        'two-process': [
+            ("from resume_parser import app", 5101, '/health'),
+            ("from ai_feedback_api import app", 5102, '/api/ai-feedback/health'),
+        ],
+        'unified': [
+            ("from service_app import create_app; app = create_app()", 5103, '/health'),
+        ],
+    }
+
+    print("📊 Python service layout benchmark")
+    print("=" * 60)
+    for layout, servers in layouts.items():
+        processes = [start_server(code, port) for code, port, _ in servers]
+        try:
+            for _, port, health_path in servers:
+                wait_until_healthy(f'http://127.0.0.1:{port}{health_path}')
+            total_rss = sum(rss_mib(process.pid) for process in processes)
+            feedback_port = servers[-1][1]
+            latencies = post_latencies(f'http://127.0.0.1:{feedback_port}/api/ai-feedback', SAMPLE_FRESHER, args.requests)
+            print(f"{layout:<28} {len(processes)} process(es), {total_rss:.1f} MiB RSS")
+            summarize(f"{layout} feedback", latencies)
+        finally:
+            for process in processes:
+                process.terminate()
+                process.wait()
+
+    from python_service import MaverickPythonService
+    service = MaverickPythonService()
+    latencies = []
+    for _ in range(args.requests):
+        start = time.perf_counter()
+        service.generate_feedback(SAMPLE_FRESHER)
+        latencies.append(time.perf_counter() - start)
+    summarize("in-process feedback", latencies)
+
+if __name__ == "__main__":
+    main()
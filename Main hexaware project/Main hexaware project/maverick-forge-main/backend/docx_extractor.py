@@ -0,0 +1,92 @@
+import re
+import zipfile
+from typing import IO, Iterator, List, Union
+from xml.etree.ElementTree import iterparse
+
+# --- WordprocessingML names ---
+W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+MC_NS = "http://schemas.openxmlformats.org/markup-compatibility/2006"
+
+W_BODY = f"{{{W_NS}}}body"
+W_HDR = f"{{{W_NS}}}hdr"
+W_FTR = f"{{{W_NS}}}ftr"
+W_P = f"{{{W_NS}}}p"
+W_T = f"{{{W_NS}}}t"
+W_TAB = f"{{{W_NS}}}tab"
+W_BR = f"{{{W_NS}}}br"
+W_CR = f"{{{W_NS}}}cr"
+# Text boxes are stored twice (DrawingML choice + VML fallback); read only the choice
+MC_FALLBACK = f"{{{MC_NS}}}Fallback"
+
+BLOCK_CONTAINERS = (W_BODY, W_HDR, W_FTR)
+
+DOCUMENT_PART = "word/document.xml"
+HEADER_PART = re.compile(r"^word/header\d*\.xml$")
+FOOTER_PART = re.compile(r"^word/footer\d*\.xml$")
+
+
+def _docx_parts(archive: zipfile.ZipFile) -> List[str]:
+    """Headers, then the main document, then footers."""
+    names = archive.namelist()
+    headers = sorted(name for name in names if HEADER_PART.match(name))
+    footers = sorted(name for name in names if FOOTER_PART.match(name))
+    return headers + [DOCUMENT_PART] + footers
+
+
+def _iter_part_paragraphs(part: IO[bytes]) -> Iterator[str]:
+    """
+    Yield non-empty paragraph text from one XML part. Covers body
+    paragraphs, table cells and text boxes; finished blocks are dropped as
+    soon as they are read so memory does not grow with the document.
+    """
+    paragraphs: List[List[str]] = []  # open paragraphs; text boxes nest inside runs
+    elements = []
+    fallback_depth = 0
+
+    for event, elem in iterparse(part, events=("start", "end")):
+        tag = elem.tag
+        if event == "start":
+            elements.append(elem)
+            if tag == MC_FALLBACK:
+                fallback_depth += 1
+            elif tag == W_P and not fallback_depth:
+                paragraphs.append([])
+            continue
+
+        elements.pop()
+        if tag == MC_FALLBACK:
+            fallback_depth -= 1
+        elif fallback_depth:
+            pass
+        elif tag == W_T:
+            if paragraphs and elem.text:
+                paragraphs[-1].append(elem.text)
+        elif tag == W_TAB:
+            if paragraphs:
+                paragraphs[-1].append("\t")
+        elif tag in (W_BR, W_CR):
+            if paragraphs:
+                paragraphs[-1].append("\n")
+        elif tag == W_P:
+            text = "".join(paragraphs.pop())
+            if text:
+                yield text
+
+        # Drop finished top-level blocks from the tree
+        if elements and elements[-1].tag in BLOCK_CONTAINERS:
+            elements[-1].remove(elem)
+        elif not elements:
+            elem.clear()
+
+
+def iter_docx_paragraphs(docx_file: Union[str, IO[bytes]]) -> Iterator[str]:
+    """Stream paragraph text from a DOCX file without building a document model."""
+    with zipfile.ZipFile(docx_file) as archive:
+        for name in _docx_parts(archive):
+            with archive.open(name) as part:
+                yield from _iter_part_paragraphs(part)
+
+
+def extract_docx_text(docx_file: Union[str, IO[bytes]]) -> str:
+    """Extract all text from a DOCX file, one paragraph per line."""
+    return "\n".join(iter_docx_paragraphs(docx_file))
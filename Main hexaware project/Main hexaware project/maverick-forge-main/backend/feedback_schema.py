@@ -0,0 +1,100 @@
+import math
+from typing import Dict, List, Any, Optional, Tuple
+
+# Score fields in the order AIFeedbackGenerator.generate_feedback_from_scores expects
+SCORE_FIELDS = ('quizzes', 'coding', 'assignments', 'certifications')
+MIN_SCORE = 0
+MAX_SCORE = 100
+
+Scores = Tuple[int, int, int, int]
+
+
+class FeedbackSchema:
+    """
+    Validates fresher feedback payloads in a single pass. Field checks are
+    compiled once at construction; validate() returns the parsed scores so
+    valid records need no further parsing.
+    """
+
+    def __init__(self, required_fields: Tuple[str, ...] = (),
+                 score_fields: Tuple[str, ...] = SCORE_FIELDS,
+                 min_score: int = MIN_SCORE, max_score: int = MAX_SCORE):
+        self.required_fields = tuple(required_fields)
+        self.score_fields = tuple(score_fields)
+        self.min_score = min_score
+        self.max_score = max_score
+        self._range_message = f'must be between {min_score} and {max_score}'
+
+    def _parse_score(self, field: str, value: Any, errors: List[str]) -> int:
+        # Fast path: plain in-range integers, which is what valid traffic sends
+        if type(value) is int:
+            number = value
+        elif isinstance(value, bool) or value is None:
+            errors.append(f"'{field}' must be a number")
+            return 0
+        elif isinstance(value, (int, float, str)):
+            # Floats and numeric strings follow the same rules: range-checked
+            # as given, and only whole numbers accepted (85.0 / "85" but not 85.7)
+            try:
+                number = value if isinstance(value, int) else float(value)
+            except ValueError:
+                errors.append(f"'{field}' must be a number")
+                return 0
+            if isinstance(number, float) and not math.isfinite(number):
+                errors.append(f"'{field}' must be a number")
+                return 0
+        else:
+            errors.append(f"'{field}' must be a number")
+            return 0
+
+        if not self.min_score <= number <= self.max_score:
+            errors.append(f"'{field}' {self._range_message}")
+            return 0
+        if number != int(number):
+            errors.append(f"'{field}' must be a whole number")
+            return 0
+        return int(number)
+
+    def validate(self, record: Any) -> Tuple[Optional[Scores], List[str]]:
+        """
+        Validate one record. Returns (scores, []) when valid, (None, errors) otherwise
+        """
+        if not isinstance(record, dict):
+            return None, ['record must be an object']
+
+        errors: List[str] = []
+        for field in self.required_fields:
+            # Required fields are identifiers: an int or a non-blank string
+            value = record.get(field)
+            if value is None or (isinstance(value, str) and not value.strip()):
+                errors.append(f"'{field}' is required")
+            elif not isinstance(value, (int, str)) or isinstance(value, bool):
+                errors.append(f"'{field}' must be an integer or a string")
+
+        # Missing scores default to 0, matching generate_feedback
+        scores = tuple(self._parse_score(field, record.get(field, 0), errors) for field in self.score_fields)
+        if errors:
+            return None, errors
+        return scores, errors
+
+    def validate_batch(self, records: List[Any]) -> Tuple[List[int], List[Scores], List[Dict[str, Any]]]:
+        """
+        Validate a batch. Returns the indices and parsed scores of valid
+        records, plus a rejection entry for each invalid record
+        """
+        valid_indices: List[int] = []
+        valid_scores: List[Scores] = []
+        rejected: List[Dict[str, Any]] = []
+        for index, record in enumerate(records):
+            scores, errors = self.validate(record)
+            if errors:
+                rejected.append({'index': index, 'errors': errors})
+            else:
+                valid_indices.append(index)
+                valid_scores.append(scores)
+        return valid_indices, valid_scores, rejected
+
+
+# Compiled once at import; the API uses these for every request
+SINGLE_FEEDBACK_SCHEMA = FeedbackSchema()
+BATCH_FEEDBACK_SCHEMA = FeedbackSchema(required_fields=('id',))
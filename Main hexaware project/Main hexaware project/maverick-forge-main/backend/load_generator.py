@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Load generator for the Python services
+Drives interactive feedback, bulk batch feedback and resume uploads at the
+same time and reports per-lane status codes, latency and admission metrics.
+
+Start the unified service first (python service_app.py), then e.g.:
+    python load_generator.py --duration 20 --interactive 16 --bulk 8 --resume 4
+"""
+
+import argparse
+import io
+import statistics
+import threading
+import time
+import zipfile
+from collections import Counter
+
+import requests
+
+SAMPLE_FRESHER = {
+    'id': 1,
+    'name': 'Load Test',
+    'quizzes': 75,
+    'coding': 80,
+    'assignments': 85,
+    'certifications': 70
+}
+
+DOCUMENT_XML = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"><w:body>
+<w:p><w:r><w:t>Load Test {index}</w:t></w:r></w:p>
+<w:p><w:r><w:t>SKILLS</w:t></w:r></w:p>
+<w:p><w:r><w:t>Python, React, SQL, Git</w:t></w:r></w:p>
+</w:body></w:document>"""
+
+def build_resume(index):
+    """Small unique DOCX so uploads are not served from the parse cache"""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as archive:
+        archive.writestr('word/document.xml', DOCUMENT_XML.format(index=index))
+    return buffer.getvalue()
+
+def make_request(lane, session, base_url, index, batch_size):
+    if lane == 'interactive':
+        return session.post(f'{base_url}/api/ai-feedback', json=SAMPLE_FRESHER)
+    if lane == 'bulk':
+        batch = [{**SAMPLE_FRESHER, 'id': n} for n in range(batch_size)]
+        return session.post(f'{base_url}/api/ai-feedback/batch', json=batch)
+    files = {'resume': (f'resume_{index}.docx', build_resume(index))}
+    return session.post(f'{base_url}/parse_resume', files=files)
+
+def run_worker(lane, base_url, deadline, batch_size, results, lock, counter):
+    session = requests.Session()
+    while time.time() < deadline:
+        with lock:
+            index = next(counter)
+        retry_after = 0.0
+        start = time.perf_counter()
+        try:
+            response = make_request(lane, session, base_url, index, batch_size)
+            status = response.status_code
+            if status == 429:
+                retry_after = float(response.headers.get('Retry-After', 1))
+        except requests.RequestException:
+            status = 'connection_error'
+        elapsed = time.perf_counter() - start
+        with lock:
+            results[lane]['statuses'][status] += 1
+            results[lane]['latencies'].append(elapsed)
+        # Honour Retry-After like a well-behaved client (capped to keep load up)
+        time.sleep(min(retry_after, 1.0))
+
+def main():
+    parser = argparse.ArgumentParser(description='Load generator for the Python services')
+    parser.add_argument('--base-url', default='http://127.0.0.1:5001')
+    parser.add_argument('--duration', type=float, default=10.0, help='Seconds to run')
+    parser.add_argument('--interactive', type=int, default=16, help='Concurrent interactive clients')
+    parser.add_argument('--bulk', type=int, default=8, help='Concurrent batch feedback clients')
+    parser.add_argument('--resume', type=int, default=4, help='Concurrent resume upload clients')
+    parser.add_argument('--batch-size', type=int, default=500)
+    args = parser.parse_args()
+
+    lanes = {'interactive': args.interactive, 'bulk': args.bulk, 'resume': args.resume}
+    results = {lane: {'statuses': Counter(), 'latencies': []} for lane in lanes}
+    lock = threading.Lock()
+    counter = iter(range(10 ** 9))
+    deadline = time.time() + args.duration
+
+    threads = [
+        threading.Thread(target=run_worker, args=(lane, args.base_url, deadline, args.batch_size, results, lock, counter))
+        for lane, clients in lanes.items() for _ in range(clients)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    print(f"🚦 Load test against {args.base_url} for {args.duration:.0f}s")
+    print("=" * 60)
+    for lane, result in results.items():
+        latencies = sorted(result['latencies'])
+        if not latencies:
+            continue
+        p95 = latencies[max(0, int(len(latencies) * 0.95) - 1)]
+        statuses = ', '.join(f'{status}: {count}' for status, count in sorted(result['statuses'].items(), key=str))
+        print(f"{lane:<12} requests {len(latencies):>6}   median {statistics.median(latencies) * 1000:>8.1f} ms"
+              f"   p95 {p95 * 1000:>8.1f} ms   [{statuses}]")
+
+    try:
+        admission = requests.get(f'{args.base_url}/metrics').json()['admission']
+        print("\n📊 Admission control")
+        for lane, stats in admission['lanes'].items():
+            print(f"{lane:<12} admitted {stats['admitted']:>6}   queue depth {stats['queue_depth']:>3}   rejected {stats['rejected']}")
+    except (requests.RequestException, KeyError, ValueError):
+        print("\n⚠️  /metrics not available (is the service running?)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""
+In-process API for the Python services
+Batch jobs can call the same operations as the HTTP endpoints without an HTTP round trip
+"""
+
+from typing import Dict, List, Any, Tuple
+from shared_resources import get_resources
+from resume_parser import parse_resume_payload
+from ai_feedback_api import feedback_payload, batch_feedback_payload
+
+class MaverickPythonService:
+    """
+    Each method returns the same body the matching HTTP endpoint would, with
+    the HTTP status code under 'http_status'.
+    """
+
+    def __init__(self, resources=None):
+        self.resources = resources or get_resources()
+
+    def _call(self, name: str, operation, *args) -> Dict[str, Any]:
+        with self.resources.metrics.timer(f'inprocess.{name}'):
+            payload, status = operation(*args)
+        self.resources.metrics.increment(f'inprocess.{name}.{status}')
+        return {**payload, 'http_status': status}
+
+    def generate_feedback(self, fresher_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Same as POST /api/ai-feedback"""
+        return self._call('feedback', feedback_payload, fresher_data)
+
+    def generate_batch_feedback(self, freshers_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Same as POST /api/ai-feedback/batch"""
+        return self._call('batch_feedback', batch_feedback_payload, freshers_data)
+
+    def parse_resume(self, filename: str, file_bytes: bytes) -> Dict[str, Any]:
+        """Same as POST /parse_resume"""
+        return self._call('parse_resume', parse_resume_payload, filename, file_bytes, self.resources)
+
+    def parse_resumes(self, files: List[Tuple[str, bytes]]) -> List[Dict[str, Any]]:
+        """Parse several resumes on the shared worker thread pool, preserving order"""
+        return list(self.resources.executor.map(lambda item: self.parse_resume(*item), files))
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            **self.resources.metrics.snapshot(),
+            'cache': self.resources.cache.stats(),
+            'admission': self.resources.admission.snapshot()
+        }
@@ -1,16 +1,20 @@
-import os
 import io
+import copy
 import json
-from flask import Flask, request, jsonify
+import hashlib
+from flask import Flask, Blueprint, request, jsonify
 from flask_cors import CORS
-from dotenv import load_dotenv
 import google.generativeai as genai
 from PyPDF2 import PdfReader
-from docx import Document
+from docx_extractor import extract_docx_text
+from resume_sections import build_skills_input
+from shared_resources import get_resources, current_resources, init_app
+from admission_control import admission_lane
+from service_metrics import service_bp
 
 # --- Configuration ---
-load_dotenv()
-GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
+# The Gemini SDK is configured once per process, so this reads the process-wide config
+GEMINI_API_KEY = get_resources().config['GEMINI_API_KEY']
 
 if not GEMINI_API_KEY:
     print("⚠️  GEMINI_API_KEY not found in .env file. Using fallback mode.")
@@ -18,8 +22,7 @@ if not GEMINI_API_KEY:
 else:
     genai.configure(api_key=GEMINI_API_KEY)
 
-app = Flask(__name__)
-CORS(app)  # Enable CORS for all routes
+resume_parser_bp = Blueprint('resume_parser', __name__)
 
 # --- Resume Text Extraction Utilities ---
 def extract_text_from_pdf(pdf_file):
@@ -34,12 +37,10 @@ def extract_text_from_pdf(pdf_file):
     return text
 
 def extract_text_from_docx(docx_file):
-    """Extracts text from a DOCX file."""
+    """Extracts text from a DOCX file, including tables, headers and text boxes."""
     text = ""
     try:
-        document = Document(docx_file)
-        for paragraph in document.paragraphs:
-            text += paragraph.text + "\n"
+        text = extract_docx_text(docx_file)
     except Exception as e:
         print(f"Error extracting text from DOCX: {e}")
     return text
@@ -77,11 +78,16 @@ def extract_skills_fallback(resume_text):
 
 # --- Gemini AI Integration ---
 def get_gemini_skills(resume_text):
-    """Uses Gemini to extract skills from resume text."""
+    """Uses Gemini to extract skills from the skills-relevant sections of resume text."""
+    # Only the skills-relevant sections go to the model (or the fallback matcher)
+    skills_text, segmentation = build_skills_input(resume_text)
+    print(f"Resume segmentation ({segmentation['mode']}): {segmentation['original_chars']} -> "
+          f"{segmentation['compact_chars']} chars, saved {segmentation['saved_chars']}")
+
     if not genai:
         print("Using fallback skill extraction")
-        skills = extract_skills_fallback(resume_text)
-        return {"skills": skills, "mode": "fallback"}
+        skills = extract_skills_fallback(skills_text)
+        return {"skills": skills, "mode": "fallback", "segmentation": segmentation}
 
     try:
         model = genai.GenerativeModel('models/gemini-1.5-flash-latest')
@@ -89,14 +95,14 @@ def get_gemini_skills(resume_text):
         # Optimized prompt for fresher skill extraction
         prompt = f"""
         You are an expert resume parser for entry-level candidates (freshers).
-        Analyze the following resume text and extract all relevant technical skills, programming languages, frameworks, tools, and important soft skills.
+        Analyze the following resume sections and extract all relevant technical skills, programming languages, frameworks, tools, and important soft skills.
         Focus exclusively on skills. Do NOT include personal details, education history, work experience descriptions, project details, or any other non-skill information.
         Provide the output as a JSON array of strings, where each string is a unique skill.
         Ensure skills are concise and directly identifiable.
 
         Resume Text:
         ---
-        {resume_text}
+        {skills_text}
         ---
 
         Example Expected Output Format:
@@ -112,21 +118,62 @@ def get_gemini_skills(resume_text):
         # Attempt to parse as JSON. If it's a list, wrap it in a dict for consistency.
         parsed_data = json.loads(response_text)
         if isinstance(parsed_data, list):
-            return {"skills": parsed_data, "mode": "ai"}
+            return {"skills": parsed_data, "mode": "ai", "segmentation": segmentation}
         else:  # If Gemini returns an object for some reason, try to find a 'skills' key
-            return parsed_data if "skills" in parsed_data and isinstance(parsed_data["skills"], list) else {"skills": [], "mode": "ai"}
+            skills_data = parsed_data if "skills" in parsed_data and isinstance(parsed_data["skills"], list) else {"skills": [], "mode": "ai"}
+            return {**skills_data, "segmentation": segmentation}
 
     except json.JSONDecodeError:
         print(f"Gemini response was not valid JSON: {response_text}")
-        skills = extract_skills_fallback(resume_text)
-        return {"skills": skills, "mode": "fallback"}
+        skills = extract_skills_fallback(skills_text)
+        return {"skills": skills, "mode": "fallback", "segmentation": segmentation}
     except Exception as e:
         print(f"Error calling Gemini API or processing response: {e}")
-        skills = extract_skills_fallback(resume_text)
-        return {"skills": skills, "mode": "fallback"}
+        skills = extract_skills_fallback(skills_text)
+        return {"skills": skills, "mode": "fallback", "segmentation": segmentation}
+
+# --- Operations (shared by the HTTP routes and the in-process API) ---
+def parse_resume_payload(filename, file_bytes, resources=None):
+    """Parses resume file contents. Returns the response body and HTTP status."""
+    resources = resources or current_resources()
+    file_extension = filename.split('.')[-1].lower()
+    if file_extension not in ('pdf', 'docx'):
+        return {"error": "Unsupported file type. Please upload a PDF or DOCX."}, 400
+
+    # Identical uploads (re-submits, retries) skip extraction and the Gemini call
+    cache_key = ('parse_resume', file_extension, hashlib.sha256(file_bytes).hexdigest())
+    cached = resources.cache.get(cache_key)
+    if cached is not None:
+        # Copies on the way in and out, so callers cannot edit the cached result
+        return copy.deepcopy(cached), 200
+
+    if file_extension == 'pdf':
+        resume_text = extract_text_from_pdf(io.BytesIO(file_bytes))
+    else:
+        resume_text = extract_text_from_docx(io.BytesIO(file_bytes))
+
+    if not resume_text.strip():
+        return {"error": "Could not extract text from the resume. The file might be corrupted or empty."}, 400
+
+    skills_data = get_gemini_skills(resume_text)
+
+    # Return appropriate status code based on whether skills were found or an error occurred
+    if "error" in skills_data:
+        return skills_data, 500
+    if not skills_data.get("skills"):
+        payload = {"skills": [], "message": "No specific skills identified.", "mode": skills_data.get("mode", "unknown"), "segmentation": skills_data.get("segmentation")}
+    else:
+        payload = {
+            **skills_data,
+            "message": "Skills extracted using basic analysis (AI unavailable)" if skills_data.get("mode") == "fallback" else "Skills extracted using AI analysis"
+        }
+    # Fallback results after an AI error are not cached, so a later upload retries Gemini
+    if skills_data.get("mode") == "ai" or genai is None:
+        resources.cache.set(cache_key, copy.deepcopy(payload))
+    return payload, 200
 
 # --- Flask Routes ---
-@app.route('/health')
+@resume_parser_bp.route('/health')
 def health_check():
     """Health check endpoint."""
     return jsonify({
@@ -136,7 +183,8 @@ def health_check():
         "mode": "ai" if genai else "fallback"
     })
 
-@app.route('/parse_resume', methods=['POST'])
+@resume_parser_bp.route('/parse_resume', methods=['POST'])
+@admission_lane('resume')
 def parse_resume():
     """API endpoint to parse an uploaded resume."""
     if 'resume' not in request.files:
@@ -146,31 +194,19 @@ def parse_resume():
     if resume_file.filename == '':
         return jsonify({"error": "No selected file"}), 400
 
-    file_extension = resume_file.filename.split('.')[-1].lower()
-    resume_text = ""
-
-    if file_extension == 'pdf':
-        resume_text = extract_text_from_pdf(io.BytesIO(resume_file.read()))
-    elif file_extension == 'docx':
-        resume_text = extract_text_from_docx(io.BytesIO(resume_file.read()))
-    else:
-        return jsonify({"error": "Unsupported file type. Please upload a PDF or DOCX."}), 400
+    payload, status = parse_resume_payload(resume_file.filename, resume_file.read())
+    return jsonify(payload), status
 
-    if not resume_text.strip():
-        return jsonify({"error": "Could not extract text from the resume. The file might be corrupted or empty."}), 400
+def create_app():
+    """Standalone resume parser service (port 5001)."""
+    app = Flask(__name__)
+    CORS(app)  # Enable CORS for all routes
+    init_app(app)
+    app.register_blueprint(resume_parser_bp)
+    app.register_blueprint(service_bp)  # /metrics and request timing
+    return app
 
-    skills_data = get_gemini_skills(resume_text)
-
-    # Return appropriate status code based on whether skills were found or an error occurred
-    if "error" in skills_data:
-        return jsonify(skills_data), 500
-    if not skills_data.get("skills"):
-        return jsonify({"skills": [], "message": "No specific skills identified.", "mode": skills_data.get("mode", "unknown")}), 200
-    
-    return jsonify({
-        **skills_data,
-        "message": "Skills extracted using basic analysis (AI unavailable)" if skills_data.get("mode") == "fallback" else "Skills extracted using AI analysis"
-    }), 200
+app = create_app()
 
 if __name__ == '__main__':
     app.run(debug=True, host='0.0.0.0', port=5001) 
\ No newline at end of file
@@ -0,0 +1,156 @@
+import os
+import re
+from typing import Dict, List, Any, Tuple
+
+# Heading text (lower case) -> canonical section name
+SECTION_HEADINGS = {
+    'skills': 'skills',
+    'technical skills': 'skills',
+    'key skills': 'skills',
+    'core skills': 'skills',
+    'core competencies': 'skills',
+    'soft skills': 'skills',
+    'skills and tools': 'skills',
+    'skills & tools': 'skills',
+    'skill set': 'skills',
+    'skillset': 'skills',
+    'technologies': 'skills',
+    'tech stack': 'skills',
+    'tools': 'skills',
+    'tools and technologies': 'skills',
+    'tools & technologies': 'skills',
+    'programming languages': 'skills',
+    'certifications': 'certifications',
+    'certificates': 'certifications',
+    'projects': 'projects',
+    'academic projects': 'projects',
+    'personal projects': 'projects',
+    'experience': 'experience',
+    'work experience': 'experience',
+    'professional experience': 'experience',
+    'internships': 'experience',
+    'internship': 'experience',
+    'employment history': 'experience',
+    'education': 'education',
+    'academic details': 'education',
+    'academics': 'education',
+    'personal details': 'personal',
+    'personal information': 'personal',
+    'contact': 'personal',
+    'contact details': 'personal',
+    'address': 'personal',
+    'hobbies': 'personal',
+    'interests': 'personal',
+    'declaration': 'personal',
+    'references': 'personal',
+    'summary': 'summary',
+    'profile': 'summary',
+    'objective': 'summary',
+    'career objective': 'summary',
+    'achievements': 'achievements',
+}
+
+# Sections sent to the skill extractor, most valuable first. Skills lists are
+# dense; project and experience narratives fill whatever budget is left.
+# 'other' holds sections under headings we do not recognise ("TECHNICAL
+# PROFICIENCY"), which may well list skills.
+RELEVANT_SECTIONS = ('skills', 'certifications', 'projects', 'experience', 'other')
+
+# Rough English average; good enough for budgeting, not for billing
+CHARS_PER_TOKEN = 4
+DEFAULT_TOKEN_BUDGET = int(os.getenv("RESUME_PROMPT_TOKEN_BUDGET", "1500"))
+
+# Longest line accepted as a standalone heading
+MAX_HEADING_LINE = 60
+
+# Longest line accepted as an unrecognised heading
+MAX_UNKNOWN_HEADING_LINE = 40
+
+# A heading on its own line ("SKILLS", "Technical Skills:") or followed by
+# inline content after a separator ("Skills: Python, Java", "Skills - Python").
+# A dash only separates when preceded by whitespace, so "Skills-based hiring"
+# is not a heading.
+_HEADING_PATTERN = re.compile(
+    r'^[\W_]*(?P<heading>'
+    + '|'.join(re.escape(heading) for heading in sorted(SECTION_HEADINGS, key=len, reverse=True))
+    + r')\s*(?:(?:[:|]|(?<=\s)[-–](?=\s|$))\s*(?P<rest>.*))?$',
+    re.IGNORECASE
+)
+
+# Words only, e.g. "TECHNICAL PROFICIENCY" or "Languages Known:"
+_UNKNOWN_HEADING_PATTERN = re.compile(r'^[A-Za-z][A-Za-z &/]*:?$')
+
+
+def _is_unknown_heading(line: str) -> bool:
+    """A short heading-like line (all caps, or ending in ':') not in SECTION_HEADINGS."""
+    if len(line) > MAX_UNKNOWN_HEADING_LINE or not _UNKNOWN_HEADING_PATTERN.match(line):
+        return False
+    return line.endswith(':') or line.isupper()
+
+
+def segment_resume(resume_text: str) -> List[Tuple[str, str]]:
+    """
+    Split resume text into (section, text) pairs in document order. Text
+    before the first heading is returned as the 'preamble'; sections under
+    unrecognised headings are returned as 'other'.
+    """
+    sections: List[Tuple[str, List[str]]] = [('preamble', [])]
+    for line in resume_text.splitlines():
+        stripped = line.strip()
+        match = _HEADING_PATTERN.match(stripped)
+        # Inline sections ("Skills: ...") can be any length; a standalone
+        # heading is a short line of its own
+        if match and (match.group('rest') or len(stripped) <= MAX_HEADING_LINE):
+            heading = ' '.join(match.group('heading').lower().split())
+            sections.append((SECTION_HEADINGS[heading], []))
+            rest = match.group('rest')
+            if rest:
+                sections[-1][1].append(rest)
+        elif _is_unknown_heading(stripped):
+            # Keep the heading: it is the only hint of what the section holds
+            sections.append(('other', [stripped.rstrip(':')]))
+        elif stripped:
+            sections[-1][1].append(stripped)
+
+    return [(name, '\n'.join(lines)) for name, lines in sections if lines or name != 'preamble']
+
+
+def build_skills_input(resume_text: str, token_budget: int = DEFAULT_TOKEN_BUDGET) -> Tuple[str, Dict[str, Any]]:
+    """
+    Build a compact, token-budgeted text holding only the skills-relevant
+    sections. Falls back to the full text when no skills section is found.
+    Returns the text and stats on how much it saved.
+    """
+    sections = segment_resume(resume_text)
+    char_budget = token_budget * CHARS_PER_TOKEN
+
+    parts: List[str] = []
+    used = 0
+    for section in RELEVANT_SECTIONS:
+        for name, text in sections:
+            if name != section or not text or used >= char_budget:
+                continue
+            if used + len(text) > char_budget:
+                # Cut on a line boundary so the last item is not half a skill
+                text = text[:char_budget - used].rsplit('\n', 1)[0]
+                if not text:
+                    continue
+            parts.append(text)
+            used += len(text) + 1
+
+    found_sections = sorted({name for name, _ in sections if name in RELEVANT_SECTIONS})
+    if parts and 'skills' in found_sections:
+        compact_text = '\n'.join(parts)
+        mode = 'sections'
+    else:
+        compact_text = resume_text
+        mode = 'full_text'
+
+    stats = {
+        'mode': mode,
+        'sections': found_sections,
+        'original_chars': len(resume_text),
+        'compact_chars': len(compact_text),
+        'saved_chars': len(resume_text) - len(compact_text),
+    }
+    return compact_text, stats
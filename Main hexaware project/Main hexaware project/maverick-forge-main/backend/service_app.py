@@ -0,0 +1,25 @@
+from flask import Flask
+from flask_cors import CORS
+from shared_resources import get_resources, init_app
+from resume_parser import resume_parser_bp
+from ai_feedback_api import ai_feedback_bp
+from service_metrics import service_bp
+
+def create_app(resources=None):
+    """
+    Single Python service hosting the resume parser and the AI feedback
+    API on one port, with one config, thread pool, cache and metrics registry.
+    """
+    app = Flask(__name__)
+    resources = init_app(app, resources)
+    app.config.update(resources.config)
+    CORS(app)  # Enable CORS for all routes
+
+    app.register_blueprint(resume_parser_bp)
+    app.register_blueprint(ai_feedback_bp)
+    app.register_blueprint(service_bp)  # /metrics and request timing
+    return app
+
+if __name__ == '__main__':
+    resources = get_resources()
+    create_app(resources).run(debug=True, host=resources.config['FLASK_HOST'], port=resources.config['FLASK_PORT'])
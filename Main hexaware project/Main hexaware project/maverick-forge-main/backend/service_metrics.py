@@ -0,0 +1,30 @@
+import time
+from flask import Blueprint, g, request, jsonify
+from shared_resources import current_resources
+
+# Registered on every app (unified and standalone) so each process exports its metrics
+service_bp = Blueprint('service', __name__)
+
+@service_bp.before_app_request
+def start_request_timer():
+    g.request_started = time.perf_counter()
+
+@service_bp.after_app_request
+def record_request_metrics(response):
+    metrics = current_resources().metrics
+    endpoint = request.endpoint or 'unknown'
+    metrics.increment(f'http.{endpoint}.{response.status_code}')
+    started = g.get('request_started')
+    if started is not None:
+        metrics.observe(f'http.{endpoint}', time.perf_counter() - started)
+    return response
+
+@service_bp.route('/metrics')
+def metrics():
+    """Request counters, timings, cache stats and admission lanes for this process."""
+    resources = current_resources()
+    return jsonify({
+        **resources.metrics.snapshot(),
+        'cache': resources.cache.stats(),
+        'admission': resources.admission.snapshot()
+    })
@@ -0,0 +1,167 @@
+import os
+import json
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional
+
+from dotenv import load_dotenv
+from flask import current_app, has_app_context
+
+from admission_control import AdmissionController
+
+
+def load_config() -> Dict[str, Any]:
+    """Read service configuration from the environment (.env included) once."""
+    load_dotenv()
+    return {
+        'GEMINI_API_KEY': os.getenv("GEMINI_API_KEY"),
+        'FLASK_HOST': os.getenv("FLASK_HOST", "0.0.0.0"),
+        'FLASK_PORT': int(os.getenv("FLASK_PORT", "5001")),
+        'WORKER_THREADS': int(os.getenv("PYTHON_SERVICE_WORKER_THREADS", "8")),
+        'CACHE_SIZE': int(os.getenv("PYTHON_SERVICE_CACHE_SIZE", "256")),
+        # JSON object overriding admission_control.DEFAULT_LANES per lane and setting,
+        # e.g. '{"bulk": {"rate": 1}}' for load tests
+        'ADMISSION_LANES': json.loads(os.getenv("ADMISSION_LANES")) if os.getenv("ADMISSION_LANES") else None,
+        'ADMISSION_TOTAL_SLOTS': int(os.getenv("ADMISSION_TOTAL_SLOTS", "12")),
+    }
+
+
+class LRUCache:
+    """Small thread-safe LRU cache."""
+
+    def __init__(self, max_size: int = 256):
+        self.max_size = max_size
+        self._items: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key in self._items:
+                self._items.move_to_end(key)
+                self.hits += 1
+                return self._items[key]
+            self.misses += 1
+            return default
+
+    def set(self, key, value):
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_size:
+                self._items.popitem(last=False)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {'size': len(self._items), 'hits': self.hits, 'misses': self.misses}
+
+
+class MetricsRegistry:
+    """Process-wide counters and request timings."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: Dict[str, int] = {}
+        self._timings: Dict[str, Dict[str, float]] = {}
+
+    def increment(self, name: str, amount: int = 1):
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + amount
+
+    def observe(self, name: str, seconds: float):
+        with self._lock:
+            timing = self._timings.setdefault(name, {'count': 0, 'total_seconds': 0.0, 'max_seconds': 0.0})
+            timing['count'] += 1
+            timing['total_seconds'] += seconds
+            timing['max_seconds'] = max(timing['max_seconds'], seconds)
+
+    def timer(self, name: str):
+        return _Timer(self, name)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'counters': dict(self._counters),
+                'timings': {name: dict(timing) for name, timing in self._timings.items()},
+            }
+
+
+class _Timer:
+    def __init__(self, registry: MetricsRegistry, name: str):
+        self.registry = registry
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.registry.observe(self.name, time.perf_counter() - self.start)
+        return False
+
+
+class SharedResources:
+    """
+    Config, worker thread pool, cache, metrics and admission control shared
+    by every service mounted in one Python process.
+    """
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        self.config = config if config is not None else load_config()
+        self.cache = LRUCache(self.config.get('CACHE_SIZE', 256))
+        self.metrics = MetricsRegistry()
+        self.admission = AdmissionController(self.config.get('ADMISSION_LANES'),
+                                             self.config.get('ADMISSION_TOTAL_SLOTS'))
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.config.get('WORKER_THREADS', 8),
+                    thread_name_prefix='maverick-worker'
+                )
+            return self._executor
+
+    def shutdown(self):
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+
+
+_resources: Optional[SharedResources] = None
+_resources_lock = threading.Lock()
+
+# Key under which a Flask app keeps its SharedResources
+EXTENSION_KEY = 'maverick_resources'
+
+
+def get_resources() -> SharedResources:
+    """The process-wide SharedResources instance, created on first use."""
+    global _resources
+    with _resources_lock:
+        if _resources is None:
+            _resources = SharedResources()
+        return _resources
+
+
+def init_app(app, resources: Optional[SharedResources] = None) -> SharedResources:
+    """Attach resources to a Flask app (the process-wide instance by default)."""
+    resources = resources or get_resources()
+    app.extensions[EXTENSION_KEY] = resources
+    return resources
+
+
+def current_resources() -> SharedResources:
+    """Resources of the active Flask app, or the process-wide instance outside a request."""
+    if has_app_context():
+        resources = current_app.extensions.get(EXTENSION_KEY)
+        if resources is not None:
+            return resources
+    return get_resources()
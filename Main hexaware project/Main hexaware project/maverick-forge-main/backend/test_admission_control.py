@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Test script for rate limiting and admission control
+"""
+
+import threading
+import time
+
+from admission_control import TokenBucket, AdmissionController, DEFAULT_LANES, CLOSED_LANE_RETRY_AFTER
+
+def _lanes(**overrides):
+    lanes = {
+        'interactive': {'priority': 0, 'rate': 1000.0, 'burst': 1000, 'max_concurrency': 1, 'max_queue_depth': 1, 'queue_timeout': 2.0},
+        'bulk': {'priority': 2, 'rate': 1000.0, 'burst': 1000, 'max_concurrency': 1, 'max_queue_depth': 0, 'queue_timeout': 2.0},
+    }
+    for lane, settings in overrides.items():
+        lanes[lane].update(settings)
+    return lanes
+
+def test_token_bucket():
+    """The bucket allows a burst, then reports how long to wait"""
+    bucket = TokenBucket(rate=10.0, capacity=2)
+    assert bucket.try_acquire() == 0
+    assert bucket.try_acquire() == 0
+    retry_after = bucket.try_acquire()
+    assert 0 < retry_after <= 0.1
+    print("✅ Token bucket limits bursts")
+
+def test_partial_lane_overrides_keep_defaults():
+    """Overriding one setting of one lane keeps the other settings and lanes"""
+    controller = AdmissionController({'bulk': {'rate': 1}})
+    assert set(controller.lanes) == set(DEFAULT_LANES)
+    assert controller.lanes['bulk'].bucket.rate == 1
+    assert controller.lanes['bulk'].max_queue_depth == DEFAULT_LANES['bulk']['max_queue_depth']
+    assert controller.acquire('interactive')[0]
+    controller.release('interactive')
+    print("✅ Partial lane overrides merge over the defaults")
+
+def test_rate_limited_lane_is_rejected():
+    controller = AdmissionController(_lanes(bulk={'rate': 0.5, 'burst': 1}))
+    assert controller.acquire('bulk') == (True, 0.0)
+    controller.release('bulk')
+    admitted, retry_after = controller.acquire('bulk')
+    assert not admitted and retry_after > 1
+    assert controller.snapshot()['lanes']['bulk']['rejected']['rate_limited'] == 1
+    print("✅ Rate-limited requests are rejected with a retry delay")
+
+def test_closed_lane_is_rejected():
+    """A lane switched off with rate 0 answers 429 instead of failing"""
+    controller = AdmissionController({'bulk': {'rate': 0, 'burst': 0}})
+    admitted, retry_after = controller.acquire('bulk')
+    assert not admitted and retry_after == CLOSED_LANE_RETRY_AFTER
+    assert controller.acquire('interactive')[0]
+    controller.release('interactive')
+    print("✅ Closed lane rejects with a fixed retry delay")
+
+def test_full_queue_is_rejected_fast():
+    """Past the queue-depth limit a request is rejected without waiting"""
+    controller = AdmissionController(_lanes())
+    assert controller.acquire('bulk')[0]
+    start = time.perf_counter()
+    admitted, _ = controller.acquire('bulk')
+    assert not admitted
+    assert time.perf_counter() - start < 0.1
+    assert controller.snapshot()['lanes']['bulk']['rejected']['queue_full'] == 1
+    controller.release('bulk')
+    print("✅ Full lane queue rejects immediately")
+
+def test_queue_rejections_do_not_spend_tokens():
+    """Requests rejected as queue_full or queue_timeout leave the bucket untouched"""
+    controller = AdmissionController(_lanes(bulk={'rate': 0.001, 'burst': 2, 'max_queue_depth': 1, 'queue_timeout': 0.05}))
+    assert controller.acquire('bulk')[0]
+
+    # One request times out in the queue while the other finds it full
+    results = []
+    waiter = threading.Thread(target=lambda: results.append(controller.acquire('bulk')[0]))
+    waiter.start()
+    while controller.snapshot()['lanes']['bulk']['queue_depth'] == 0:
+        time.sleep(0.001)
+    assert not controller.acquire('bulk')[0]
+    waiter.join()
+    assert results == [False]
+
+    rejected = controller.snapshot()['lanes']['bulk']['rejected']
+    assert rejected == {'rate_limited': 0, 'queue_full': 1, 'queue_timeout': 1}
+
+    # The second burst token is still there once a slot frees up
+    controller.release('bulk')
+    assert controller.acquire('bulk')[0]
+    controller.release('bulk')
+    print("✅ Queue rejections do not drain the token bucket")
+
+def test_interactive_lane_has_priority():
+    """A queued interactive request gets the next free slot ahead of queued bulk work"""
+    controller = AdmissionController(
+        _lanes(interactive={'max_concurrency': 2}, bulk={'max_queue_depth': 1}),
+        total_slots=1
+    )
+    assert controller.acquire('interactive')[0]
+
+    order = []
+    def run(lane):
+        if controller.acquire(lane)[0]:
+            order.append(lane)
+            controller.release(lane)
+
+    # Bulk queues first, then interactive
+    threads = []
+    for lane in ('bulk', 'interactive'):
+        thread = threading.Thread(target=run, args=(lane,))
+        thread.start()
+        threads.append(thread)
+        while controller.snapshot()['lanes'][lane]['queue_depth'] == 0:
+            time.sleep(0.001)
+
+    controller.release('interactive')
+    for thread in threads:
+        thread.join()
+    assert order == ['interactive', 'bulk']
+    print("✅ Interactive lane is admitted ahead of bulk")
+
+if __name__ == "__main__":
+    test_token_bucket()
+    test_partial_lane_overrides_keep_defaults()
+    test_rate_limited_lane_is_rejected()
+    test_closed_lane_is_rejected()
+    test_full_queue_is_rejected_fast()
+    test_queue_rejections_do_not_spend_tokens()
+    test_interactive_lane_has_priority()
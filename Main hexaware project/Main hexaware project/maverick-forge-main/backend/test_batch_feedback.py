@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Test script for sharded batch feedback generation
+Checks that the process-pool path matches the inline path
+"""
+
+from batch_feedback import BatchFeedbackExecutor
+
+def _strip_timestamps(entries):
+    for entry in entries:
+        entry['feedback'].pop('generated_at', None)
+    return entries
+
+def test_parallel_matches_inline():
+    """Parallel results should equal inline results, in input order"""
+    cohort = [
+        {
+            'id': index,
+            'name': f'Fresher {index}',
+            'quizzes': (index * 7) % 101,
+            'coding': (index * 13) % 101,
+            'assignments': (index * 17) % 101,
+            'certifications': (index * 23) % 101
+        }
+        for index in range(1200)
+    ]
+    # A malformed record should still produce an error entry in place
+    cohort[5]['coding'] = 'n/a'
+
+    inline = BatchFeedbackExecutor(max_workers=1)
+    parallel = BatchFeedbackExecutor(max_workers=2, parallel_threshold=0, chunk_size=100)
+    try:
+        assert parallel.should_parallelize(len(cohort))
+        expected = _strip_timestamps(inline.generate(cohort))
+        actual = _strip_timestamps(parallel.generate(cohort))
+    finally:
+        parallel.shutdown()
+
+    assert [entry['fresher_id'] for entry in actual] == list(range(len(cohort)))
+    assert 'error' in actual[5]['feedback']
+    assert actual == expected
+    print(f"✅ Parallel batch matches inline batch for {len(cohort)} freshers")
+
+def test_small_batch_stays_inline():
+    """Cohorts below the threshold should not start a process pool"""
+    executor = BatchFeedbackExecutor(max_workers=4, parallel_threshold=100)
+    entries = executor.generate([{'id': 1, 'name': 'Solo', 'quizzes': 90, 'coding': 80,
+                                  'assignments': 70, 'certifications': 60}])
+    assert executor._pool is None
+    assert entries[0]['feedback']['overall_score'] == 75.0
+    print("✅ Small batch processed inline")
+
+def test_zero_threshold_forces_single_worker_pool():
+    """parallel_threshold=0 uses the pool even with one worker (benchmark baseline)"""
+    assert not BatchFeedbackExecutor(max_workers=1).should_parallelize(10 ** 6)
+    executor = BatchFeedbackExecutor(max_workers=1, parallel_threshold=0)
+    assert not executor.should_parallelize(0)
+    assert executor.should_parallelize(1)
+    print("✅ Zero threshold forces the pool for one worker")
+
+if __name__ == "__main__":
+    test_parallel_matches_inline()
+    test_small_batch_stays_inline()
+    test_zero_threshold_forces_single_worker_pool()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Test script for the streaming DOCX text extractor
+"""
+
+import io
+import zipfile
+
+from docx_extractor import extract_docx_text
+
+W_NS = 'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"'
+MC_NS = 'xmlns:mc="http://schemas.openxmlformats.org/markup-compatibility/2006"'
+
+DOCUMENT_XML = f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:document {W_NS} {MC_NS}>
+  <w:body>
+    <w:p><w:r><w:t>John Doe</w:t></w:r></w:p>
+    <w:p><w:r><w:t xml:space="preserve">SKILLS </w:t></w:r><w:r><w:tab/><w:t>Summary</w:t></w:r></w:p>
+    <w:tbl>
+      <w:tr>
+        <w:tc><w:p><w:r><w:t>Python</w:t></w:r></w:p></w:tc>
+        <w:tc><w:p><w:r><w:t>React</w:t></w:r></w:p></w:tc>
+      </w:tr>
+    </w:tbl>
+    <w:p>
+      <w:r>
+        <mc:AlternateContent>
+          <mc:Choice><w:txbxContent><w:p><w:r><w:t>Docker</w:t></w:r></w:p></w:txbxContent></mc:Choice>
+          <mc:Fallback><w:txbxContent><w:p><w:r><w:t>Docker</w:t></w:r></w:p></w:txbxContent></mc:Fallback>
+        </mc:AlternateContent>
+      </w:r>
+      <w:r><w:t>Line one</w:t><w:br/><w:t>Line two</w:t></w:r>
+    </w:p>
+  </w:body>
+</w:document>"""
+
+HEADER_XML = f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:hdr {W_NS}><w:p><w:r><w:t>john@example.com</w:t></w:r></w:p></w:hdr>"""
+
+def _build_docx():
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as archive:
+        archive.writestr('word/document.xml', DOCUMENT_XML)
+        archive.writestr('word/header1.xml', HEADER_XML)
+    buffer.seek(0)
+    return buffer
+
+def test_extracts_tables_headers_and_text_boxes():
+    """Header, paragraph, table cell and text box text should all be extracted once"""
+    text = extract_docx_text(_build_docx())
+    assert text.split("\n") == [
+        'john@example.com',
+        'John Doe',
+        'SKILLS \tSummary',
+        'Python',
+        'React',
+        'Docker',
+        'Line one',
+        'Line two'
+    ]
+    print("✅ DOCX extraction covers tables, headers and text boxes")
+
+if __name__ == "__main__":
+    test_extracts_tables_headers_and_text_boxes()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Test script for feedback payload validation
+"""
+
+from feedback_schema import SINGLE_FEEDBACK_SCHEMA, BATCH_FEEDBACK_SCHEMA
+
+def test_single_record_validation():
+    """Valid records return parsed scores; invalid ones return errors"""
+    scores, errors = SINGLE_FEEDBACK_SCHEMA.validate({
+        'quizzes': 75, 'coding': '80', 'assignments': 85.0, 'name': 'John Doe'
+    })
+    assert errors == []
+    assert scores == (75, 80, 85, 0)
+
+    scores, errors = SINGLE_FEEDBACK_SCHEMA.validate({
+        'quizzes': 120, 'coding': 'n/a', 'assignments': True, 'certifications': -1
+    })
+    assert scores is None
+    assert errors == [
+        "'quizzes' must be between 0 and 100",
+        "'coding' must be a number",
+        "'assignments' must be a number",
+        "'certifications' must be between 0 and 100"
+    ]
+
+    # Fractional scores are range-checked before any rounding and must be whole
+    scores, errors = SINGLE_FEEDBACK_SCHEMA.validate({
+        'quizzes': 100.5, 'coding': -0.5, 'assignments': 85.7, 'certifications': '85.5'
+    })
+    assert scores is None
+    assert errors == [
+        "'quizzes' must be between 0 and 100",
+        "'coding' must be between 0 and 100",
+        "'assignments' must be a whole number",
+        "'certifications' must be a whole number"
+    ]
+    print("✅ Single record validation")
+
+def test_batch_validation_reports_indices():
+    """Invalid records are reported by index and valid ones kept in order"""
+    records = [
+        {'id': 1, 'quizzes': 90, 'coding': 85, 'assignments': 88, 'certifications': 92},
+        {'quizzes': 50, 'coding': 50, 'assignments': 50, 'certifications': 50},
+        'not a record',
+        {'id': 4, 'quizzes': 45, 'coding': 50, 'assignments': 40, 'certifications': 35},
+        {'id': {}},
+        {'id': [1]},
+        {'id': ' '},
+        {'id': True},
+        {'id': 'F-7', 'quizzes': 70}
+    ]
+    valid_indices, valid_scores, rejected = BATCH_FEEDBACK_SCHEMA.validate_batch(records)
+    assert valid_indices == [0, 3, 8]
+    assert valid_scores == [(90, 85, 88, 92), (45, 50, 40, 35), (70, 0, 0, 0)]
+    assert rejected == [
+        {'index': 1, 'errors': ["'id' is required"]},
+        {'index': 2, 'errors': ['record must be an object']},
+        {'index': 4, 'errors': ["'id' must be an integer or a string"]},
+        {'index': 5, 'errors': ["'id' must be an integer or a string"]},
+        {'index': 6, 'errors': ["'id' is required"]},
+        {'index': 7, 'errors': ["'id' must be an integer or a string"]}
+    ]
+    print("✅ Batch validation reports rejected indices")
+
+if __name__ == "__main__":
+    test_single_record_validation()
+    test_batch_validation_reports_indices()
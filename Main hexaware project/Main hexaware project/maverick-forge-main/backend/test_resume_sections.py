@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Test script for resume section segmentation
+"""
+
+from resume_sections import segment_resume, build_skills_input
+
+SAMPLE_RESUME = """
+John Doe
+221B Baker Street, London
+john@example.com
+
+TECHNICAL SKILLS:
+- JavaScript
+- React.js
+- Python
+
+Soft Skills: Problem Solving, Teamwork
+
+EXPERIENCE:
+Software Developer Intern at TechCorp
+- Developed web applications using React and Node.js
+
+EDUCATION:
+Bachelor of Science in Computer Science
+GPA: 3.8/4.0
+
+PROJECTS
+- Weather app using JavaScript and APIs
+"""
+
+def test_segment_resume():
+    """Headings are detected with or without colons and inline content"""
+    sections = segment_resume(SAMPLE_RESUME)
+    assert [name for name, _ in sections] == [
+        'preamble', 'skills', 'skills', 'experience', 'education', 'projects'
+    ]
+    assert sections[2][1] == 'Problem Solving, Teamwork'
+    print("✅ Resume sections detected")
+
+def test_build_skills_input_drops_irrelevant_sections():
+    """Education and personal details are left out; skills come first"""
+    text, stats = build_skills_input(SAMPLE_RESUME)
+    assert text.startswith('- JavaScript')
+    assert 'Baker Street' not in text
+    assert 'GPA' not in text
+    assert 'Weather app' in text
+    assert stats['mode'] == 'sections'
+    assert stats['saved_chars'] == len(SAMPLE_RESUME) - len(text) > 0
+    print(f"✅ Compact skills input saved {stats['saved_chars']} of {stats['original_chars']} chars")
+
+def test_long_inline_skills_line_after_irrelevant_section():
+    """An inline skills line longer than a standalone heading still starts a section"""
+    resume_text = (
+        "Jane Roe\nEXPERIENCE\nIntern at Acme, built dashboards\nEDUCATION\nB.Tech CS, 2024\n"
+        "Technical Skills: Python, Java, C++, React, Node.js, SQL, Git, Docker, AWS\n"
+    )
+    text, stats = build_skills_input(resume_text)
+    assert text.startswith('Python, Java, C++, React, Node.js, SQL, Git, Docker, AWS')
+    assert 'B.Tech' not in text
+    assert stats['sections'] == ['experience', 'skills']
+    print("✅ Long inline skills line detected")
+
+def test_unknown_headings_start_their_own_section():
+    """Skills under unrecognised headings are not merged into the section before them"""
+    text, stats = build_skills_input(
+        "EDUCATION\nB.Tech\nTECHNICAL PROFICIENCY\nPython, Java, React, Docker\nPROJECTS\nWeather app"
+    )
+    assert 'Python, Java, React, Docker' in text
+    assert stats['mode'] == 'full_text'
+
+    resume_text = "SKILLS\nPython\nEDUCATION\nB.Tech\nLanguages Known:\nGo, Rust\nEXPERIENCE\nIntern"
+    sections = segment_resume(resume_text)
+    assert ('other', 'Languages Known\nGo, Rust') in sections
+    text, stats = build_skills_input(resume_text)
+    assert 'Go, Rust' in text and 'B.Tech' not in text
+    assert stats['mode'] == 'sections'
+    print("✅ Unrecognised headings start their own section")
+
+def test_no_skills_section_falls_back_to_full_text():
+    """Without a skills section the full text is sent, even if other sections were found"""
+    resume_text = "SKILLS SUMMARY\nPython, Go\nEDUCATION\nB.Tech\nEXPERIENCE\nIntern"
+    text, stats = build_skills_input(resume_text)
+    assert text == resume_text
+    assert stats['mode'] == 'full_text'
+    print("✅ Full text used when no skills section is found")
+
+def test_hyphenated_word_is_not_a_heading():
+    """A dash only separates an inline heading when surrounded by whitespace"""
+    sections = segment_resume("Jane Roe\nSkills-based hiring advocate\nSkills - Python, SQL")
+    assert sections == [('preamble', 'Jane Roe\nSkills-based hiring advocate'), ('skills', 'Python, SQL')]
+    print("✅ Hyphenated words are not headings")
+
+def test_build_skills_input_respects_budget():
+    """Skills are kept ahead of narratives when the budget is tight"""
+    text, _ = build_skills_input(SAMPLE_RESUME, token_budget=12)
+    assert text.startswith('- JavaScript')
+    assert 'Weather app' not in text
+    assert len(text) <= 48
+    print("✅ Token budget respected")
+
+def test_build_skills_input_falls_back_to_full_text():
+    """Resumes without recognised headings are sent in full"""
+    resume_text = "Jane Roe\nPython developer with Docker and AWS experience"
+    text, stats = build_skills_input(resume_text)
+    assert text == resume_text
+    assert stats['mode'] == 'full_text'
+    assert stats['saved_chars'] == 0
+    print("✅ Full-text fallback used when no sections are found")
+
+if __name__ == "__main__":
+    test_segment_resume()
+    test_build_skills_input_drops_irrelevant_sections()
+    test_long_inline_skills_line_after_irrelevant_section()
+    test_unknown_headings_start_their_own_section()
+    test_no_skills_section_falls_back_to_full_text()
+    test_hyphenated_word_is_not_a_heading()
+    test_build_skills_input_respects_budget()
+    test_build_skills_input_falls_back_to_full_text()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Test script for the unified Python service and its in-process API
+"""
+
+import io
+import zipfile
+
+from service_app import create_app
+from python_service import MaverickPythonService
+from shared_resources import SharedResources, get_resources
+
+SAMPLE_FRESHER = {
+    'id': 1,
+    'name': 'Test User',
+    'quizzes': 75,
+    'coding': 80,
+    'assignments': 85,
+    'certifications': 70
+}
+
+def test_unified_app_mounts_both_services():
+    """Both health checks and the feedback route are served by one app"""
+    client = create_app().test_client()
+    assert client.get('/health').status_code == 200
+    assert client.get('/api/ai-feedback/health').status_code == 200
+
+    response = client.post('/api/ai-feedback', json=SAMPLE_FRESHER)
+    assert response.status_code == 200
+    assert response.get_json()['feedback']['overall_score'] == 77.5
+
+    metrics = client.get('/metrics').get_json()
+    assert metrics['counters']['http.ai_feedback.generate_ai_feedback.200'] >= 1
+    print("✅ Unified app serves resume parser and AI feedback routes")
+
+def test_unified_app_uses_given_resources():
+    """Admission, metrics and request timing all use the resources passed to create_app"""
+    resources = SharedResources({'ADMISSION_TOTAL_SLOTS': 4})
+    client = create_app(resources).test_client()
+    assert client.post('/api/ai-feedback', json=SAMPLE_FRESHER).status_code == 200
+
+    metrics = client.get('/metrics').get_json()
+    assert metrics['admission']['total_slots'] == 4
+    assert metrics['admission']['lanes']['interactive']['admitted'] == 1
+    assert metrics['counters']['http.ai_feedback.generate_ai_feedback.200'] == 1
+    assert resources.admission.snapshot()['lanes']['interactive']['admitted'] == 1
+    assert resources is not get_resources()
+    print("✅ Unified app honours custom resources")
+
+def test_standalone_apps_export_metrics():
+    """The standalone services expose /metrics with their admission lanes"""
+    import resume_parser
+    import ai_feedback_api
+    for module, path in ((resume_parser, '/health'), (ai_feedback_api, '/api/ai-feedback/health')):
+        client = module.create_app().test_client()
+        assert client.get(path).status_code == 200
+        metrics = client.get('/metrics').get_json()
+        assert set(metrics['admission']['lanes']) >= {'interactive', 'resume', 'bulk'}
+        assert metrics['timings']
+    print("✅ Standalone apps export metrics")
+
+def _build_docx(text):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as archive:
+        paragraphs = ''.join(f'<w:p><w:r><w:t>{line}</w:t></w:r></w:p>' for line in text.splitlines())
+        archive.writestr('word/document.xml',
+                         '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+                         f'<w:body>{paragraphs}</w:body></w:document>')
+    return buffer.getvalue()
+
+def test_cached_resume_result_is_not_shared():
+    """Editing a parse result does not change what later uploads of the file get"""
+    import resume_parser
+    real_get_gemini_skills = resume_parser.get_gemini_skills
+    # Stand-in for Gemini so the result is cacheable without network access
+    resume_parser.get_gemini_skills = lambda text: {
+        'skills': ['Python', 'React'], 'mode': 'ai', 'segmentation': {'mode': 'sections'}
+    }
+    try:
+        service = MaverickPythonService(SharedResources({'CACHE_SIZE': 4}))
+        resume = _build_docx("Jane Roe\nSKILLS\nPython, React")
+        first = service.parse_resume('resume.docx', resume)
+        assert first['http_status'] == 200
+        first['skills'].append('Tampered')
+        first['segmentation']['mode'] = 'tampered'
+
+        second = service.parse_resume('resume.docx', resume)
+        assert second['skills'] == ['Python', 'React']
+        assert second['segmentation']['mode'] == 'sections'
+        second['skills'].clear()
+        assert service.parse_resume('resume.docx', resume)['skills'] == ['Python', 'React']
+        assert service.resources.cache.stats()['hits'] == 2
+    finally:
+        resume_parser.get_gemini_skills = real_get_gemini_skills
+    print("✅ Cached resume results are copied per caller")
+
+def test_in_process_api_matches_http():
+    """The in-process API returns the HTTP body plus the status code"""
+    service = MaverickPythonService()
+    result = service.generate_feedback(SAMPLE_FRESHER)
+    assert result['http_status'] == 200
+    assert result['feedback']['performance_level'] == 'Good'
+
+    result = service.generate_batch_feedback([SAMPLE_FRESHER, {'quizzes': 500}])
+    assert result['status'] == 'partial_success'
+    assert [entry['index'] for entry in result['rejected']] == [1]
+    print("✅ In-process API matches the HTTP endpoints")
+
+if __name__ == "__main__":
+    test_unified_app_mounts_both_services()
+    test_unified_app_uses_given_resources()
+    test_standalone_apps_export_metrics()
+    test_cached_resume_result_is_not_shared()
+    test_in_process_api_matches_http()